@@ -0,0 +1,14 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'icons/ico16_sync.svg'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    pass
+    yield '<svg\n  class="svg_icon"\n  viewBox="0 0 16 16"\n  fill="none"\n  stroke="currentColor"\n  stroke-width="1.5"\n  stroke-linecap="round"\n  stroke-linejoin="round"\n>\n  <line x1="2" y1="14" x2="5" y2="11"></line>\n  <path d="M13.5,4.8 C12.3,2.3 9.3,1.3 6.8,2.5 C4.3,3.7 3.3,6.7 4.5,9.2 C5.7,11.7 8.7,12.7 11.2,11.5"/>\n  <rect x="8" y="7.5" width="7" height="1.5"></rect>\n</svg>'
+
+blocks = {}
+debug_info = ''
\ No newline at end of file
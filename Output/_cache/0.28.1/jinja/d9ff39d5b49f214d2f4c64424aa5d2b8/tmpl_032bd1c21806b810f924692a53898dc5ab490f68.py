@@ -0,0 +1,14 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'icons/ico16_source_pointer_out.svg'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    pass
+    yield '<svg\n  class="svg_icon"\n  viewBox="0 0 16 16"\n  fill="none"\n  stroke="currentColor"\n  stroke-width="1.5"\n  stroke-linecap="round"\n  stroke-linejoin="round"\n>\n  <g class="svg_source_pointer_brackets">\n    <path d="M3.5,8 C2,9.5 1.5,10 1.5,10 C0.5,11 0.5,11 1.5,12 C1.5,12 2,12.5 3.5,14" id="lb"></path>\n    <path d="M12.5,8 C14,9.5 14.5,10 14.5,10 C15.5,11 15.5,11 14.5,12 C14.5,12 14,12.5 12.5,14" id="rb"></path>\n  </g>\n  <g class="svg_source_pointer_arrow">\n    <line x1="8" y1="12" x2="8" y2="4" id="arr0"></line>\n    <polyline points="10.5 6.5 8 4 5.5 6.5" id="arr"></polyline>\n  </g>\n</svg>'
+
+blocks = {}
+debug_info = ''
\ No newline at end of file
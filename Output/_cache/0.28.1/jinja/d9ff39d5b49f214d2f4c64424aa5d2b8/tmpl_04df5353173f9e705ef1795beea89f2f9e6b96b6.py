@@ -0,0 +1,14 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'icons/ico16_fragment.svg'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    pass
+    yield '<svg\n  class="svg_icon"\n  viewBox="0 0 16 16"\n  fill="none"\n  stroke="currentColor"\n  stroke-width="1.5"\n  stroke-linecap="round"\n  stroke-linejoin="round"\n>\n  <path d="M 6,0 V 3"/>\n  <path d="m 6,13 v 3" />\n  <path d="M 12,7 H 9 V 4"/>\n  <path d="M 13,12 V 8 C 13,7.5 13,7 12.5,6.5 l -3,-3 C 9,3 8.5,3 8,3 H 4 C 3.5,3 3,3.5 3,4 v 8 c 0,0.471405 0.5285955,1 1,1 h 8 c 0.471405,0 1,-0.528595 1,-1 z"/>\n</svg>'
+
+blocks = {}
+debug_info = ''
\ No newline at end of file
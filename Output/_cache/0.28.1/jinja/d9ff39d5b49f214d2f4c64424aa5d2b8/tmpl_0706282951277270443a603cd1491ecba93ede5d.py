@@ -0,0 +1,14 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'icons/ico16_file.svg'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    pass
+    yield '<svg\n  class="svg_icon"\n  viewBox="0 0 16 16"\n  fill="none"\n  stroke="currentColor"\n  stroke-width="1.5"\n  stroke-linecap="round"\n  stroke-linejoin="round"\n>\n  <path d="M13,13 L13,8 C13,7 12,6 12,6 C12,6 9,3 9,3 C9,3 8,2 7,2 L4,2 C3.5,2 3,2.5 3,3 L3,13 C3,13.5 3.5,14 4,14 L12,14 C12.5,14 13,13.5 13,13 Z"></path>\n  <path d="M6.5,7.5 L5,9 C5,9 5.5,9.5 6.5,10.5"></path>\n  <path d="M9,7.5 L10.5,9 C10.5,9 10,9.5 9,10.5"></path>\n</svg>'
+
+blocks = {}
+debug_info = ''
\ No newline at end of file
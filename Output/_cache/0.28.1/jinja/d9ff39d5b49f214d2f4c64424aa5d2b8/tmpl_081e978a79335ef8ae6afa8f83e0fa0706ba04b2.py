@@ -0,0 +1,14 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'features/diff_and_changelog/skeleton.jinja'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    pass
+    yield '<div class="skeleton">\n  <div class="skeleton_spinner_container">\n    <div class="skeleton_spinner"></div>\n    \n  </div>\n</div>'
+
+blocks = {}
+debug_info = ''
\ No newline at end of file
@@ -0,0 +1,160 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'features/diff_and_changelog/index.jinja'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    parent_template = None
+    l_0_view_object = resolve('view_object')
+    l_0_template_type = missing
+    pass
+    parent_template = environment.get_template('base.jinja.html', 'features/diff_and_changelog/index.jinja')
+    for name, parent_block in parent_template.blocks.items():
+        context.blocks.setdefault(name, []).append(parent_block)
+    l_0_template_type = 'DIFF'
+    context.vars['template_type'] = l_0_template_type
+    context.exported_vars.add('template_type')
+    def macro():
+        t_1 = []
+        pass
+        return concat(t_1)
+    caller = Macro(environment, macro, None, (), False, False, False, context.eval_ctx.autoescape)
+    yield context.call(environment.extensions['strictdoc.export.html.jinja.assert_extension.AssertExtension']._assert, (environment.getattr((undefined(name='view_object') if l_0_view_object is missing else l_0_view_object), 'tab') in ('diff', 'changelog')), None, caller=caller)
+    yield from parent_template.root_render_func(context)
+
+def block_head_css(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_super = context.super('head_css', block_head_css)
+    _block_vars = {}
+    l_0_view_object = resolve('view_object')
+    pass
+    yield '\n  '
+    yield escape(context.call(l_0_super, _block_vars=_block_vars))
+    yield '\n  <link rel="stylesheet" href="'
+    yield escape(context.call(environment.getattr((undefined(name='view_object') if l_0_view_object is missing else l_0_view_object), 'render_static_url'), 'diff.css', _block_vars=_block_vars))
+    yield '"/>\n'
+
+def block_head_scripts(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_super = context.super('head_scripts', block_head_scripts)
+    _block_vars = {}
+    l_0_view_object = resolve('view_object')
+    pass
+    yield '\n  '
+    yield escape(context.call(l_0_super, _block_vars=_block_vars))
+    if environment.getattr(environment.getattr((undefined(name='view_object') if l_0_view_object is missing else l_0_view_object), 'project_config'), 'is_running_on_server'):
+        pass
+        yield '<script type="module">\n    import hotwiredTurbo from "'
+        yield escape(context.call(environment.getattr((undefined(name='view_object') if l_0_view_object is missing else l_0_view_object), 'render_static_url_with_prefix'), 'turbo.min.js', _block_vars=_block_vars))
+        yield '";\n  </script>\n  <script src="'
+        yield escape(context.call(environment.getattr((undefined(name='view_object') if l_0_view_object is missing else l_0_view_object), 'render_static_url'), 'modal.js', _block_vars=_block_vars))
+        yield '"></script>\n  <script src="'
+        yield escape(context.call(environment.getattr((undefined(name='view_object') if l_0_view_object is missing else l_0_view_object), 'render_static_url'), 'action_button_guard.js', _block_vars=_block_vars))
+        yield '"></script>'
+    yield '<script src="'
+    yield escape(context.call(environment.getattr((undefined(name='view_object') if l_0_view_object is missing else l_0_view_object), 'render_static_url'), 'diff.js', _block_vars=_block_vars))
+    yield '"></script>\n'
+
+def block_title(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    l_0_view_object = resolve('view_object')
+    l_0_template_type = resolve('template_type')
+    pass
+    yield '\n  '
+    yield escape(environment.getattr(environment.getattr((undefined(name='view_object') if l_0_view_object is missing else l_0_view_object), 'project_config'), 'project_title'))
+    yield ' - '
+    yield escape((undefined(name='template_type') if l_0_template_type is missing else l_0_template_type))
+    yield '\n'
+
+def block_viewtype(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    l_0_view_object = resolve('view_object')
+    pass
+    yield escape(environment.getattr((undefined(name='view_object') if l_0_view_object is missing else l_0_view_object), 'tab'))
+
+def block_layout_nav(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield '\n  '
+    template = environment.get_template('_shared/nav.jinja.html', 'features/diff_and_changelog/index.jinja')
+    gen = template.root_render_func(template.new_context(context.get_all(), True, {}))
+    try:
+        for event in gen:
+            yield event
+    finally: gen.close()
+    yield '\n'
+
+def block_tree_content(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield '\n   \n'
+
+def block_header_content(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    l_0_template_type = resolve('template_type')
+    pass
+    l_1_header__pagetype = (undefined(name='template_type') if l_0_template_type is missing else l_0_template_type)
+    pass
+    template = environment.get_template('components/header/index.jinja', 'features/diff_and_changelog/index.jinja')
+    gen = template.root_render_func(template.new_context(context.get_all(), True, {'header__pagetype': l_1_header__pagetype}))
+    try:
+        for event in gen:
+            yield event
+    finally: gen.close()
+    l_1_header__pagetype = missing
+
+def block_main_content(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield '\n  '
+    template = environment.get_template('features/diff_and_changelog/main.jinja', 'features/diff_and_changelog/index.jinja')
+    gen = template.root_render_func(template.new_context(context.get_all(), True, {}))
+    try:
+        for event in gen:
+            yield event
+    finally: gen.close()
+    yield '\n'
+
+blocks = {'head_css': block_head_css, 'head_scripts': block_head_scripts, 'title': block_title, 'viewtype': block_viewtype, 'layout_nav': block_layout_nav, 'tree_content': block_tree_content, 'header_content': block_header_content, 'main_content': block_main_content}
+debug_info = '1=14&2=17&26=20&4=28&5=39&6=41&9=44&10=55&12=56&14=59&16=61&17=63&19=66&22=69&23=80&27=85&29=96&30=105&33=113&37=123&39=134&43=142&44=151'
\ No newline at end of file
@@ -0,0 +1,35 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'components/text_node/card.jinja'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    pass
+    yield '\n\n<sdoc-text>\n  '
+    template = environment.get_template('components/node_field/section_title/index.jinja', 'components/text_node/card.jinja')
+    gen = template.root_render_func(template.new_context(context.get_all(), True, {}))
+    try:
+        for event in gen:
+            yield event
+    finally: gen.close()
+    yield '\n  '
+    template = environment.get_template('components/node_field/uid_standalone/index.jinja', 'components/text_node/card.jinja')
+    gen = template.root_render_func(template.new_context(context.get_all(), True, {}))
+    try:
+        for event in gen:
+            yield event
+    finally: gen.close()
+    yield '\n  '
+    template = environment.get_template('components/node_field/text/index.jinja', 'components/text_node/card.jinja')
+    gen = template.root_render_func(template.new_context(context.get_all(), True, {}))
+    try:
+        for event in gen:
+            yield event
+    finally: gen.close()
+    yield '\n</sdoc-text>'
+
+blocks = {}
+debug_info = '7=12&8=19&9=26'
\ No newline at end of file
@@ -0,0 +1,14 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'icons/ico16_star.svg'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    pass
+    yield '<svg\n  class="svg_icon icon_sort"\n  viewBox="0 0 16 16"\n  fill="none"\n  stroke="currentColor"\n  stroke-width="1.5"\n  stroke-linecap="round"\n  stroke-linejoin="round"\n>\n  <path d="M 8,2.25 5.9433594,5.6679687 2.0566406,6.5683594 4.671875,9.5820313 4.3261719,13.556641 8,12 11.673828,13.556641 11.328125,9.5820313 13.943359,6.5683594 10.056641,5.6679687 Z"/>\n</svg>'
+
+blocks = {}
+debug_info = ''
\ No newline at end of file
@@ -0,0 +1,25 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = '_shared/static_search_head.jinja'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_view_object = resolve('view_object')
+    pass
+    yield '<meta name="strictdoc-project-hash" content="'
+    yield escape(context.call(environment.getattr(environment.getattr((undefined(name='view_object') if l_0_view_object is missing else l_0_view_object), 'project_config'), 'get_project_hash')))
+    yield '">\n<meta name="strictdoc-search-index-timestamp" content="'
+    yield escape(context.call(environment.getattr(environment.getattr(environment.getattr((undefined(name='view_object') if l_0_view_object is missing else l_0_view_object), 'traceability_index'), 'search_index_timestamp'), 'timestamp')))
+    yield '">\n<meta name="strictdoc-search-index-path" content="'
+    yield escape(context.call(environment.getattr((undefined(name='view_object') if l_0_view_object is missing else l_0_view_object), 'render_static_url'), 'static_html_search_index.js'))
+    yield '">\n\n\n<script src="'
+    yield escape(context.call(environment.getattr((undefined(name='view_object') if l_0_view_object is missing else l_0_view_object), 'render_static_url'), 'app_core.js'))
+    yield '"></script>\n<script src="'
+    yield escape(context.call(environment.getattr((undefined(name='view_object') if l_0_view_object is missing else l_0_view_object), 'render_static_url'), 'static_html_search.js'))
+    yield '" defer></script>'
+
+blocks = {}
+debug_info = '1=13&2=15&3=17&6=19&7=21'
\ No newline at end of file
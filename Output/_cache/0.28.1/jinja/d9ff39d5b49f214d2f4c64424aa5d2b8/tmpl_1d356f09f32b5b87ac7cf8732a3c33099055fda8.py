@@ -0,0 +1,14 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'icons/ico16_add_below.svg'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    pass
+    yield '<svg\n  class="svg_icon"\n  viewBox="0 0 16 16"\n  fill="none"\n  stroke="currentColor"\n  stroke-width="1.5"\n  stroke-linecap="round"\n  stroke-linejoin="round"\n>\n  <path d="M3,12.5 C2,12.5 1,12 1,10.5 L1,9.5 C1,8.5 2,7.5 3,7.5 L13,7.5 C14,7.5 15,8.5 15,9.5 L15,10.5 C15,12 14,12.5 13,12.5"/>\n  <line x1="5.5" y1="12.5" x2="10.5" y2="12.5"></line>\n  <line x1="8" y1="15" x2="8" y2="10"></line>\n  <path d="M3,1 C3,1 6.5,1 13,1 C14.5,1 15,2 15,3 C15,4 14.5,5 13,5 L3,5 C1.5,5 1,4 1,3 C1,2 1.5,1 3,1 Z"/>\n</svg>'
+
+blocks = {}
+debug_info = ''
\ No newline at end of file
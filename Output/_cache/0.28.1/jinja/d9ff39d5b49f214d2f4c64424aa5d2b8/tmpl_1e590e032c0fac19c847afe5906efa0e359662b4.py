@@ -0,0 +1,14 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'icons/ico16_link.svg'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    pass
+    yield '<svg\n  class="svg_icon"\n  viewBox="0 0 16 16"\n  fill="none"\n  stroke="currentColor"\n  stroke-width="1.5"\n  stroke-linecap="round"\n  stroke-linejoin="round"\n>\n  <path d="M9,7 L9.5,7.5 C10.5,8.5 10.5,9.5 9.5,10.5 L6,14 C5,15 4,15 3,14 L2,13 C1,12 1,11 2,10 L3.5,8.5"></path>\n  <path d="M7,9 L6.5,8.5 C5.5,7.5 5.5,6.5 6.5,5.5 L10,2 C11,1 12,1 13,2 L14,3 C15,4 15,5 14,6 L12.5,7.5"></path>\n</svg>'
+
+blocks = {}
+debug_info = ''
\ No newline at end of file
@@ -0,0 +1,14 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'icons/ico16_tree.svg'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    pass
+    yield '<svg\n  class="svg_icon"\n  viewBox="0 0 16 16"\n  fill="none"\n  stroke="currentColor"\n  stroke-width="1.5"\n  stroke-linecap="round"\n  stroke-linejoin="round"\n>\n  <path d="M8,13 L7,13 C6,13 5,12 5,11 L5,4 L5,6 C5,7 6,8 7,8 L8,8"></path>\n  <path d="M13,6.75 C13.345178,6.75 13.657678,6.88991102 13.8838835,7.11611652 C14.110089,7.34232203 14.25,7.65482203 14.25,8 C14.25,8.34517797 14.110089,8.65767797 13.8838835,8.88388348 C13.657678,9.11008898 13.345178,9.25 13,9.25 L10,9.25 C9.65482203,9.25 9.34232203,9.11008898 9.11611652,8.88388348 C8.88991102,8.65767797 8.75,8.34517797 8.75,8 C8.75,7.65482203 8.88991102,7.34232203 9.11611652,7.11611652 C9.34232203,6.88991102 9.65482203,6.75 10,6.75 Z"></path>\n  <path d="M7,1.75 C7.34517797,1.75 7.65767797,1.88991102 7.88388348,2.11611652 C8.11008898,2.34232203 8.25,2.65482203 8.25,3 C8.25,3.34517797 8.11008898,3.65767797 7.88388348,3.88388348 C7.65767797,4.11008898 7.34517797,4.25 7,4.25 L3,4.25 C2.65482203,4.25 2.34232203,4.11008898 2.11611652,3.88388348 C1.88991102,3.65767797 1.75,3.34517797 1.75,3 C1.75,2.65482203 1.88991102,2.34232203 2.11611652,2.11611652 C2.34232203,1.88991102 2.65482203,1.75 3,1.75 Z"></path>\n  <path d="M13,11.75 C13.345178,11.75 13.657678,11.889911 13.8838835,12.1161165 C14.110089,12.342322 14.25,12.654822 14.25,13 C14.25,13.345178 14.110089,13.657678 13.8838835,13.8838835 C13.657678,14.110089 13.345178,14.25 13,14.25 L10,14.25 C9.65482203,14.25 9.34232203,14.110089 9.11611652,13.8838835 C8.88991102,13.657678 8.75,13.345178 8.75,13 C8.75,12.654822 8.88991102,12.342322 9.11611652,12.1161165 C9.34232203,11.889911 9.65482203,11.75 10,11.75 Z"></path>\n</svg>'
+
+blocks = {}
+debug_info = ''
\ No newline at end of file
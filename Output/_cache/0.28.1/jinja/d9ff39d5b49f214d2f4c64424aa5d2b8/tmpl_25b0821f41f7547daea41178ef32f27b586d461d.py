@@ -0,0 +1,14 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'icons/ico16_logo_s_100.svg'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    pass
+    yield '<svg\n  height="16px"\n  width="16px"\n  viewBox="0 0 100 100"\n  xmlns="http://www.w3.org/2000/svg">\n  <style>\n    .line {\n      fill: none;\n      stroke-width: 6;\n      stroke: currentColor;\n    }\n    .node {\n      fill: currentColor;\n      stroke: none;\n    }\n  </style>\n\n  <path\n    class="line"\n    d="M 76,35 50,20 24,35 76,65 50,80 24,65"/>\n\n  <circle id="sdoc_n_7" class="node" cx="24" cy="65" r="9.0"/>\n  <circle id="sdoc_n_6" class="node" cx="50" cy="80" r="9.0"/>\n  <circle id="sdoc_n_5" class="node" cx="76" cy="65" r="9.0"/>\n  <circle id="sdoc_n_4" class="node" cx="50" cy="50" r="9.0"/>\n  <circle id="sdoc_n_3" class="node" cx="24" cy="35" r="9.0"/>\n  <circle id="sdoc_n_2" class="node" cx="50" cy="20" r="9.0"/>\n  <circle id="sdoc_n_1" class="node" cx="76" cy="35" r="9.0"/>\n</svg>'
+
+blocks = {}
+debug_info = ''
\ No newline at end of file
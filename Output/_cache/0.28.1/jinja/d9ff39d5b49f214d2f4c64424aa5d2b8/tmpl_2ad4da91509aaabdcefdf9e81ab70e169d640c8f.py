@@ -0,0 +1,21 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'features/project_index/frame_project_tree.jinja.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    pass
+    yield '<turbo-frame id="frame_project_tree">\n  '
+    template = environment.get_template('features/project_index/project_tree.jinja', 'features/project_index/frame_project_tree.jinja.html')
+    gen = template.root_render_func(template.new_context(context.get_all(), True, {}))
+    try:
+        for event in gen:
+            yield event
+    finally: gen.close()
+    yield '\n</turbo-frame>'
+
+blocks = {}
+debug_info = '2=12'
\ No newline at end of file
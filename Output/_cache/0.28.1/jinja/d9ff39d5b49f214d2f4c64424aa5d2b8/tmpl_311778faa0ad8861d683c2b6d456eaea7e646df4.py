@@ -0,0 +1,129 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'features/project_statistics/index.jinja'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    parent_template = None
+    l_0_template_type = missing
+    pass
+    l_0_template_type = 'Project statistics'
+    context.vars['template_type'] = l_0_template_type
+    context.exported_vars.add('template_type')
+    if parent_template is None:
+        yield '\n\n'
+    parent_template = environment.get_template('base.jinja.html', 'features/project_statistics/index.jinja')
+    for name, parent_block in parent_template.blocks.items():
+        context.blocks.setdefault(name, []).append(parent_block)
+    yield from parent_template.root_render_func(context)
+
+def block_head_css(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_super = context.super('head_css', block_head_css)
+    _block_vars = {}
+    pass
+    yield '\n  '
+    yield escape(context.call(l_0_super, _block_vars=_block_vars))
+    yield '\n'
+
+def block_head_scripts(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_super = context.super('head_scripts', block_head_scripts)
+    _block_vars = {}
+    pass
+    yield '\n  '
+    yield escape(context.call(l_0_super, _block_vars=_block_vars))
+    yield '\n'
+
+def block_title(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    l_0_view_object = resolve('view_object')
+    l_0_template_type = resolve('template_type')
+    pass
+    yield '\n  '
+    yield escape(environment.getattr(environment.getattr((undefined(name='view_object') if l_0_view_object is missing else l_0_view_object), 'project_config'), 'project_title'))
+    yield ' - '
+    yield escape((undefined(name='template_type') if l_0_template_type is missing else l_0_template_type))
+    yield '\n'
+
+def block_viewtype(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield 'project-statistics'
+
+def block_layout_nav(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield '\n  '
+    template = environment.get_template('_shared/nav.jinja.html', 'features/project_statistics/index.jinja')
+    gen = template.root_render_func(template.new_context(context.get_all(), True, {}))
+    try:
+        for event in gen:
+            yield event
+    finally: gen.close()
+    yield '\n'
+
+def block_header_content(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    l_0_template_type = resolve('template_type')
+    pass
+    l_1_header__pagetype = (undefined(name='template_type') if l_0_template_type is missing else l_0_template_type)
+    pass
+    template = environment.get_template('components/header/index.jinja', 'features/project_statistics/index.jinja')
+    gen = template.root_render_func(template.new_context(context.get_all(), True, {'header__pagetype': l_1_header__pagetype}))
+    try:
+        for event in gen:
+            yield event
+    finally: gen.close()
+    l_1_header__pagetype = missing
+
+def block_main_content(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield '\n  '
+    template = environment.get_template('features/project_statistics/main.jinja', 'features/project_statistics/index.jinja')
+    gen = template.root_render_func(template.new_context(context.get_all(), True, {}))
+    try:
+        for event in gen:
+            yield event
+    finally: gen.close()
+    yield '\n'
+
+blocks = {'head_css': block_head_css, 'head_scripts': block_head_scripts, 'title': block_title, 'viewtype': block_viewtype, 'layout_nav': block_layout_nav, 'header_content': block_header_content, 'main_content': block_main_content}
+debug_info = '1=13&3=18&5=23&6=33&9=36&10=46&13=49&14=60&17=65&19=75&20=84&23=92&25=103&29=111&30=120'
\ No newline at end of file
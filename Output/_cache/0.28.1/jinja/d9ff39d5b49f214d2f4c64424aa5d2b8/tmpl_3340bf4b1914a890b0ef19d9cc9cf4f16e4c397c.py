@@ -0,0 +1,14 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'icons/ico100_broken_link.svg'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    pass
+    yield '<svg\n   width="200"\n   height="200"\n   viewBox="0 0 100 100"\n   fill="none"\n   stroke="currentColor"\n   stroke-width="3"\n   stroke-linecap="round"\n   stroke-linejoin="round"\n>\n    <path d="m 76.382812,20 c -3.48066,0 -6.962286,1.347772 -9.623046,4.042969 L 54.433594,36.529297 a 0.52916503,0.52916503 0 0 0 0.0039,0.748047 0.52916503,0.52916503 0 0 0 0.748047,-0.0039 L 67.513672,24.785156 c 4.922502,-4.986209 12.813829,-4.98621 17.736328,0 4.922498,4.986208 4.922503,13.002067 0,17.988281 L 72.923828,55.259766 c -4.922502,4.98621 -12.815783,4.986207 -17.738281,0 a 0.52916503,0.52916503 0 0 0 -0.748047,-0.0059 0.52916503,0.52916503 0 0 0 -0.0039,0.75 c 5.321517,5.390391 13.922619,5.390394 19.24414,0 L 86.003906,43.515625 c 5.321522,-5.390398 5.321518,-14.082266 0,-19.472656 C 83.343147,21.347772 79.863473,20 76.382812,20 Z"/>\n    <path d="m 35.941406,39.958984 c -3.48066,-10e-7 -6.962285,1.347772 -9.623047,4.042969 L 13.992188,56.488281 c -5.3215223,5.390387 -5.3215181,14.084212 0,19.47461 5.321519,5.39039 13.922619,5.390386 19.24414,0 L 45.5625,63.474609 a 0.52916503,0.52916503 0 0 0 -0.0039,-0.748047 0.52916503,0.52916503 0 0 0 -0.748047,0.0059 L 32.482422,75.21875 c -4.922503,4.986204 -12.81578,4.986207 -17.738281,0 -4.9224994,-4.986214 -4.9225019,-13.000125 0,-17.986328 L 27.072266,44.744141 c 4.922503,-4.986212 12.815778,-4.986204 17.738281,0 a 0.52916503,0.52916503 0 0 0 0.748047,0.0059 0.52916503,0.52916503 0 0 0 0.0039,-0.748047 C 42.901739,41.30676 39.422061,39.959026 35.9414,39.959025 Z"/>\n    <g d="g20">\n      <path d="m 41.566406,21.025391 a 0.52916503,0.52916503 0 0 0 -0.134765,0.02539 0.52916503,0.52916503 0 0 0 -0.339844,0.666016 l 2.583984,7.947265 a 0.52916503,0.52916503 0 0 0 0.666016,0.339844 0.52916503,0.52916503 0 0 0 0.339844,-0.666015 l -2.583985,-7.947266 a 0.52916503,0.52916503 0 0 0 -0.53125,-0.365234 z"/>\n      <path d="m 54.779297,20.962891 a 0.52916503,0.52916503 0 0 0 -0.441406,0.289062 L 50.3125,29.230469 a 0.52916503,0.52916503 0 0 0 0.234375,0.710937 0.52916503,0.52916503 0 0 0 0.710937,-0.234375 l 4.023438,-7.978515 a 0.52916503,0.52916503 0 0 0 -0.234375,-0.710938 0.52916503,0.52916503 0 0 0 -0.267578,-0.05469 z"/>\n      <path d="m 30.931641,29.037109 a 0.52916503,0.52916503 0 0 0 -0.441407,0.291016 0.52916503,0.52916503 0 0 0 0.238282,0.710937 l 7.898437,3.941407 a 0.52916503,0.52916503 0 0 0 0.708984,-0.238282 0.52916503,0.52916503 0 0 0 -0.236328,-0.708984 l -7.898437,-3.941406 a 0.52916503,0.52916503 0 0 0 -0.269531,-0.05469 z"/>\n    </g>\n    <g d="g21">\n      <path d="M 55.789062,69.974609 A 0.52916503,0.52916503 0 0 0 55.654297,70 0.52916503,0.52916503 0 0 0 55.314453,70.667969 l 2.582031,7.947265 a 0.52916503,0.52916503 0 0 0 0.667969,0.337891 0.52916503,0.52916503 0 0 0 0.339844,-0.666016 l -2.583985,-7.947265 a 0.52916503,0.52916503 0 0 0 -0.53125,-0.365235 z"/>\n      <path d="m 49.179687,70.007812 a 0.52916503,0.52916503 0 0 0 -0.134765,0.02539 0.52916503,0.52916503 0 0 0 -0.306641,0.263672 l -4.02539,7.980469 a 0.52916503,0.52916503 0 0 0 0.234375,0.710937 0.52916503,0.52916503 0 0 0 0.710937,-0.234375 l 4.023438,-7.980469 A 0.52916503,0.52916503 0 0 0 49.447266,70.0625 0.52916503,0.52916503 0 0 0 49.179687,70.007812 Z"/>\n      <path d="m 61.099609,65.970703 a 0.52916503,0.52916503 0 0 0 -0.441406,0.291016 0.52916503,0.52916503 0 0 0 0.238281,0.708984 l 7.898438,3.941406 a 0.52916503,0.52916503 0 0 0 0.710937,-0.236328 0.52916503,0.52916503 0 0 0 -0.238281,-0.708984 l -7.898437,-3.941406 a 0.52916503,0.52916503 0 0 0 -0.269532,-0.05469 z"/>\n    </g>\n</svg>'
+
+blocks = {}
+debug_info = ''
\ No newline at end of file
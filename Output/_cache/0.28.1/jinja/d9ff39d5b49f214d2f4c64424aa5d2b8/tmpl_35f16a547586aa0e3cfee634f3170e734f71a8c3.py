@@ -0,0 +1,121 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'features/nestor/index.jinja'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    parent_template = None
+    l_0_template_type = missing
+    pass
+    l_0_template_type = 'Project index'
+    context.vars['template_type'] = l_0_template_type
+    context.exported_vars.add('template_type')
+    if parent_template is None:
+        yield '\n\n'
+    parent_template = environment.get_template('base.jinja.html', 'features/nestor/index.jinja')
+    for name, parent_block in parent_template.blocks.items():
+        context.blocks.setdefault(name, []).append(parent_block)
+    yield from parent_template.root_render_func(context)
+
+def block_head_css(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_super = context.super('head_css', block_head_css)
+    _block_vars = {}
+    l_0_view_object = resolve('view_object')
+    pass
+    yield '\n  '
+    yield escape(context.call(l_0_super, _block_vars=_block_vars))
+    yield '\n  <link rel="stylesheet" href="'
+    yield escape(context.call(environment.getattr((undefined(name='view_object') if l_0_view_object is missing else l_0_view_object), 'render_static_url'), 'project_tree.css', _block_vars=_block_vars))
+    yield '"/>\n'
+
+def block_head_scripts(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    l_0_view_object = resolve('view_object')
+    pass
+    yield '\n  <script src="'
+    yield escape(context.call(environment.getattr((undefined(name='view_object') if l_0_view_object is missing else l_0_view_object), 'render_static_url'), 'nestor/bundle.umd.js', _block_vars=_block_vars))
+    yield '"></script>\n  <script>\n    var graphNestor = new GraphNestor();\n    graphNestor.render(\''
+    yield escape(environment.getattr((undefined(name='view_object') if l_0_view_object is missing else l_0_view_object), 'path_to_json'))
+    yield "');\n  </script>\n"
+
+def block_title(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    l_0_view_object = resolve('view_object')
+    l_0_template_type = resolve('template_type')
+    pass
+    yield '\n  '
+    yield escape(environment.getattr(environment.getattr((undefined(name='view_object') if l_0_view_object is missing else l_0_view_object), 'project_config'), 'project_title'))
+    yield ' - '
+    yield escape((undefined(name='template_type') if l_0_template_type is missing else l_0_template_type))
+    yield '\n'
+
+def block_viewtype(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield 'NESTOR • ALPHA'
+
+def block_layout_nav(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield '\n  \n'
+
+def block_toc_content(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield '\n'
+
+def block_header_content(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield '\n<div class="header">\nNestor alpha\n</div>\n  \n'
+
+def block_main_content(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield '\n  <div id="app" style="display:contents"></div>\n'
+
+blocks = {'head_css': block_head_css, 'head_scripts': block_head_scripts, 'title': block_title, 'viewtype': block_viewtype, 'layout_nav': block_layout_nav, 'toc_content': block_toc_content, 'header_content': block_header_content, 'main_content': block_main_content}
+debug_info = '1=13&3=18&5=23&6=34&7=36&10=39&11=49&14=51&18=54&19=65&22=70&24=80&28=90&31=100&43=110'
\ No newline at end of file
@@ -0,0 +1,14 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'icons/ico16_edit.svg'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    pass
+    yield '<svg\n  class="svg_icon"\n  viewBox="0 0 16 16"\n  fill="none"\n  stroke="currentColor"\n  stroke-width="1.5"\n  stroke-linecap="round"\n  stroke-linejoin="round"\n>\n  <path d="M2,13.25 L3,10 L10.5,2.5 C11.5,1.5 12.5,1.5 13.5,2.5 C14.5,3.5 14.5,4.5 13.5,5.5 L6,13 L2.75,14 C2.75,14 2.25,14.25 2,14 C1.75,13.75 2,13.25 2,13.25 Z"></path>\n  <line x1="9" y1="4" x2="12" y2="7"></line>\n</svg>'
+
+blocks = {}
+debug_info = ''
\ No newline at end of file
@@ -0,0 +1,14 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'icons/ico16_go_to_doc.svg'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    pass
+    yield '<svg\n  class="svg_icon"\n  viewBox="0 0 16 16"\n  fill="none"\n  stroke="currentColor"\n  stroke-width="1.5"\n  stroke-linecap="round"\n  stroke-linejoin="round"\n>\n  <path d="M13,8 C13,7.5 12.5,7 12,7 L9,7 C8.5,7 8,6.5 8,6 L8,3 C8,2.5 7.5,2 7,2 L4,2 C3.5,2 3,2.5 3,3 L3,13 C3,13.5 3.5,14 4,14 L6,14" />\n  <line x1="8" y1="12" x2="14" y2="12" stroke-linecap="round"></line>\n  <polyline stroke-linecap="round" points="10 9.5 7.5 12 10 14.5"></polyline>\n  <path d="M13,9 C13,7 13,7 12.5,6.5 C11.5,5.5 10.8,4.8 10.3,4.3 C9.9,3.9 9.3,3.3 8.5,2.5 C8,2 7.5,2 7,2 L6,2" />\n</svg>'
+
+blocks = {}
+debug_info = ''
\ No newline at end of file
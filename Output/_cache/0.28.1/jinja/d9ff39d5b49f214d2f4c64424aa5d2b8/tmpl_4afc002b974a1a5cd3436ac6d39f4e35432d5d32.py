@@ -0,0 +1,14 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'icons/ico16_code.svg'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    pass
+    yield '<svg\n  class="svg_icon"\n  viewBox="0 0 16 16"\n  fill="none"\n  stroke="currentColor"\n  stroke-width="1.5"\n  stroke-linecap="round"\n  stroke-linejoin="round"\n>\n  <line x1="10" y1="3" x2="6" y2="13"></line>\n  <path d="M3.5,5 C2.5,6 1.5,7 1.5,7 C0.5,8 0.5,8 1.5,9 C1.5,9 2.5,10 3.5,11"/>\n  <path d="M12.5,5 C14,6.5 14.5,7 14.5,7 C15.5,8 15.5,8 14.5,9 C14.5,9 14,9.5 12.5,11"/>\n</svg>'
+
+blocks = {}
+debug_info = ''
\ No newline at end of file
@@ -0,0 +1,14 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'icons/ico16_3dots.svg'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    pass
+    yield '<svg class="svg_icon" viewBox="0 0 16 16">\n  <circle cx="2" cy="8" r="1"></circle>\n  <circle cx="8" cy="8" r="1"></circle>\n  <circle cx="14" cy="8" r="1"></circle>\n</svg>'
+
+blocks = {}
+debug_info = ''
\ No newline at end of file
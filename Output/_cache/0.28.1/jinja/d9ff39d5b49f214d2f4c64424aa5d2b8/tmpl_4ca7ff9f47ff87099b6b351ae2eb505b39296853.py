@@ -0,0 +1,14 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'icons/ico16_toc.svg'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    pass
+    yield '<svg\n  class="svg_icon"\n  viewBox="0 0 16 16"\n  fill="none"\n  stroke="currentColor"\n  stroke-width="1.5"\n  stroke-linecap="round"\n  stroke-linejoin="round"\n>\n  <line class="horz" x1="2" y1="12" x2="14" y2="12" id="q3"></line>\n  <line x1="2" y1="8" x2="14" y2="8" id="q2"></line>\n  <line class="horz" x1="2" y1="4" x2="14" y2="4" id="q1"></line>\n  <line class="arrw" x1="2" y1="8" x2="8" y2="14" id="q33"></line>\n  <line class="arrw" x1="2" y1="8" x2="8" y2="2" id="q11"></line>\n</svg>'
+
+blocks = {}
+debug_info = ''
\ No newline at end of file
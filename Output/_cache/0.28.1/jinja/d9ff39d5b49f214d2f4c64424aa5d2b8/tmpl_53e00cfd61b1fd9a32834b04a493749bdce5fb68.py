@@ -0,0 +1,14 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'icons/ico16_diff.svg'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    pass
+    yield '<svg\n  class="svg_icon"\n  viewBox="0 0 16 16"\n  fill="none"\n  stroke="currentColor"\n  stroke-width="1.5"\n  stroke-linecap="round"\n  stroke-linejoin="round"\n>\n  <circle cx="3" cy="3" r="2"></circle>\n  <circle cx="13" cy="13" r="2"></circle>\n  <path d="M8,13 C4.5,13.5 3,12.5 3,10 C3,10 3,8.5 3,5" />\n  <path d="M8,3 C11.5,2.5 13,3.5 13,6 C13,5 13,7.5 13,11" />\n  <polyline points="6.5 15 8.5 13 6.5 11" />\n  <polyline points="9.5 1 7.5 3 9.5 5" />\n</svg>'
+
+blocks = {}
+debug_info = ''
\ No newline at end of file
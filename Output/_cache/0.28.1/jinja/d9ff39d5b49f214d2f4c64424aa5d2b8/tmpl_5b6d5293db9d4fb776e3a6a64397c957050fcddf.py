@@ -0,0 +1,57 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'components/node/card.jinja'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_sdoc_entity = resolve('sdoc_entity')
+    l_0_view_object = resolve('view_object')
+    l_0_node_controls = resolve('node_controls')
+    try:
+        t_1 = environment.tests['defined']
+    except KeyError:
+        @internalcode
+        def t_1(*unused):
+            raise TemplateRuntimeError("No test named 'defined' found.")
+    pass
+    yield '\n\n  <sdoc-node\n    node-style="card"\n    node-role="'
+    yield escape(context.call(environment.getattr((undefined(name='sdoc_entity') if l_0_sdoc_entity is missing else l_0_sdoc_entity), 'get_type_string')))
+    yield '"\n    data-testid="node-'
+    yield escape(context.call(environment.getattr((undefined(name='sdoc_entity') if l_0_sdoc_entity is missing else l_0_sdoc_entity), 'get_type_string')))
+    yield '"\n  >\n\n    \n    '
+    template = environment.get_template('components/anchor/index.jinja', 'components/node/card.jinja')
+    gen = template.root_render_func(template.new_context(context.get_all(), True, {}))
+    try:
+        for event in gen:
+            yield event
+    finally: gen.close()
+    yield '\n\n    \n    '
+    yield from context.blocks['sdoc_entity'][0](context)
+    yield '\n\n    '
+    if environment.getattr(environment.getattr((undefined(name='view_object') if l_0_view_object is missing else l_0_view_object), 'project_config'), 'is_running_on_server'):
+        pass
+        if t_1((undefined(name='node_controls') if l_0_node_controls is missing else l_0_node_controls)):
+            pass
+            template = environment.get_template('components/node/node_controls/card.jinja', 'components/node/card.jinja')
+            gen = template.root_render_func(template.new_context(context.get_all(), True, {}))
+            try:
+                for event in gen:
+                    yield event
+            finally: gen.close()
+    yield '</sdoc-node>'
+
+def block_sdoc_entity(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield '\n    \n    '
+
+blocks = {'sdoc_entity': block_sdoc_entity}
+debug_info = '5=21&6=23&10=25&13=32&18=34&19=36&20=38&13=46'
\ No newline at end of file
@@ -0,0 +1,14 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'icons/ico16_6dots.svg'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    pass
+    yield '<svg class="svg_icon" viewBox="0 0 16 16">\n  <circle cy="4" cx="10" r="0.25"></circle>\n  <circle cy="8" cx="10" r="0.25"></circle>\n  <circle cy="12" cx="10" r="0.25"></circle>\n\n  <circle cy="4" cx="6" r="0.25"></circle>\n  <circle cy="8" cx="6" r="0.25"></circle>\n  <circle cy="12" cx="6" r="0.25"></circle>\n</svg>'
+
+blocks = {}
+debug_info = ''
\ No newline at end of file
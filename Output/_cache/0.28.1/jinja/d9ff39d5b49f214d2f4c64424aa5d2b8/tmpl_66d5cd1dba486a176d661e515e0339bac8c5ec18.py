@@ -0,0 +1,14 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'icons/ico16_add_child.svg'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    pass
+    yield '<svg\n  class="svg_icon"\n  viewBox="0 0 16 16"\n  fill="none"\n  stroke="currentColor"\n  stroke-width="1.5"\n  stroke-linecap="round"\n  stroke-linejoin="round"\n>\n  <line x1="2" y1="11" x2="7" y2="11" ></line>\n  <line x1="4.5" y1="13.5" x2="4.5" y2="8.5" ></line>\n  <path d="M3,1 C3,1 6.5,1 13,1 C14.5,1 15,2 15,3 C15,4 14.5,5 13,5 L3,5 C1.5,5 1,4 1,3 C1,2 1.5,1 3,1 Z"/>\n  <path d="M12,11 C12,11 12.5,11 13,11 C14.5,11 15,12 15,13 C15,14 14.5,15 13,15 L12,15 C10.5,15 10,14 10,13 C10,12 10.5,11 12,11 Z"/>\n  <line x1="12.5" y1="10.5" x2="12.5" y2="5.5"></line>\n</svg>'
+
+blocks = {}
+debug_info = ''
\ No newline at end of file
@@ -0,0 +1,14 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'features/diff_and_changelog/legend.jinja'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    pass
+    yield '<sdoc-main-legend\n  data-testid="changelog-main-legend"\n>\n    <p>The Diff/Changelog feature only works when StrictDoc is run against a\xa0directory which is a\xa0Git repository.</p>\n    <p>The left-hand-side (LHS) and the right-hand-side (RHS) revisions must be valid Git revisions.</p>\n    <p>A valid revision can be a\xa0Git branch, a\xa0Git commit or a\xa0Git tag.</p>\n    <p>Examples:</p>\n\n    <div class="sdoc-table_key_value">\n      <div class="sdoc-table_key_value-key">Git branch</div>\n      <div class="sdoc-table_key_value-value">\n        <code>main</code>\n        <br>\n        <code>origin/main</code>\n      </div>\n      <div class="sdoc-table_key_value-key">Git commit</div>\n      <div class="sdoc-table_key_value-value">\n        <code>63fd78411f864382349e951c51d3c4ce1b90fd28</code>\n        <br>\n        <code>63fd784</code>\n      </div>\n      <div class="sdoc-table_key_value-key">Git tag</div>\n      <div class="sdoc-table_key_value-value">\n        <code>v1.0.0</code>\n      </div>\n      <div class="sdoc-table_key_value-key">Custom</div>\n      <div class="sdoc-table_key_value-value">\n        <code>HEAD+</code>\n        <br>\n        <small>The StrictDoc\'s custom revision <code>HEAD+</code> can be used to indicate "the current branch + all uncommitted changes".</small>\n      </div>\n    </div>\n\n    <p>The Diff/Changelog query is shareable via a URL.</p>\n    <p>Examples:</p>\n    <div class="sdoc-table_key_value">\n      \n      <a href="http://127.0.0.1:5111/diff?left_revision=HEAD&right_revision=HEAD%2B&tab=diff"\n         class="sdoc-table_key_value-key">HEAD vs. HEAD+</a>\n      \n        <div class="sdoc-table_key_value-value">\n        Open a diff between the last commit and the existing changes to the Git tree.\n      </div>\n    </div>\n    <div class="sdoc-table_key_value">\n      \n      <a href="http://127.0.0.1:5111/diff?left_revision=HEAD^&right_revision=HEAD&tab=diff"\n         class="sdoc-table_key_value-key">HEAD^ vs. HEAD</a>\n      \n        <div class="sdoc-table_key_value-value">\n        Open a diff between the last commit and the commit before it.\n      </div>\n    </div>\n    <div class="sdoc-table_key_value">\n      \n      <a href="http://127.0.0.1:5111/diff?left_revision=origin/main&right_revision=HEAD&tab=diff"\n         class="sdoc-table_key_value-key">origin/main vs. HEAD</a>\n      \n        <div class="sdoc-table_key_value-value">\n        Open a diff between the last commit on origin/main and the last commit on the current branch.\n      </div>\n    </div>\n\n    <p>The StrictDoc diff algorithm compares documentation trees (left-hand side, LHS, and right-hand side, RHS) based on these principles:</p>\n    <ul>\n      <li>\n        Optimal comparison of document contents is achieved using automatically-generated Machine Identifiers (MID). This ensures the best match.\n      </li>\n      <li>\n        If document nodes, such as Sections or Requirements, lack MIDs, they are matched using their UID field. Matching quality with UIDs is comparable to that with MIDs, provided all nodes have UIDs.\n      </li>\n      <li>\n        In cases where document nodes do not have either MID or UID, matching generally isn\'t performed or is very limited to the most basic cases. Changes to nodes lacking MID/UID are recorded as separate events: "node removed" for LHS and "node added" for RHS.\n      </li>\n    </ul>\n</sdoc-main-legend>'
+
+blocks = {}
+debug_info = ''
\ No newline at end of file
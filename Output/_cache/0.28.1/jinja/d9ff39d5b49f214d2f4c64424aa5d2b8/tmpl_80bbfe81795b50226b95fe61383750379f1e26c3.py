@@ -0,0 +1,14 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'icons/ico16_add_above.svg'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    pass
+    yield '<svg\n  class="svg_icon"\n  viewBox="0 0 16 16"\n  fill="none"\n  stroke="currentColor"\n  stroke-width="1.5"\n  stroke-linecap="round"\n  stroke-linejoin="round"\n>\n  <path d="M3,3.5 C2,3.5 1,4 1,5.5 L1,6.5 C1,7.5 2,8.5 3,8.5 L13,8.5 C14,8.5 15,7.5 15,6.5 L15,5.5 C15,4 14,3.5 13,3.5"/>\n  <line x1="5.5" y1="3.5" x2="10.5" y2="3.5"></line>\n  <line x1="8" y1="1" x2="8" y2="6"></line>\n  <path d="M3,15 L13,15 C14.5,15 15,14 15,13 C15,12 14.5,11 13,11 L3,11 C1.5,11 1,12 1,13 C1,14 1.5,15 3,15 Z"/>\n</svg>'
+
+blocks = {}
+debug_info = ''
\ No newline at end of file
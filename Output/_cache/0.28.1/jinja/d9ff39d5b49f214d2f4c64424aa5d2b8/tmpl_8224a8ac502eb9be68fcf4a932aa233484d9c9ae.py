@@ -0,0 +1,14 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'icons/ico16_export.svg'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    pass
+    yield '<svg\n  class="svg_icon"\n  viewBox="0 0 16 16"\n  fill="none"\n  stroke="currentColor"\n  stroke-width="1.5"\n  stroke-linecap="round"\n  stroke-linejoin="round"\n>\n  <path d="m 13,11 c 0,1.118073 -0.881927,2 -2,2 H 5 C 3.8819273,13 3,12.118073 3,11 V 5 C 3,3.8819273 3.8819273,3 5,3" />\n  <path d="M 7,9 13,3" />\n  <path d="m 9,3 h 4 v 4" />\n</svg>'
+
+blocks = {}
+debug_info = ''
\ No newline at end of file
@@ -0,0 +1,14 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'icons/ico16_delete.svg'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    pass
+    yield '<svg\n  class="svg_icon"\n  viewBox="0 0 16 16"\n  fill="none"\n  stroke="currentColor"\n  stroke-width="1.5"\n  stroke-linecap="round"\n  stroke-linejoin="round"\n>\n  <polyline points="13 5 12 14 4 14 3 5"></polyline>\n  <line x1="2" y1="5" x2="14" y2="5"></line>\n  <line x1="9.5" y1="7.5" x2="9.5" y2="11.5"></line>\n  <line x1="6.5" y1="7.5" x2="6.5" y2="11.5"></line>\n  <path d="M10,4 C10,2.8954305 9.1045695,2 8,2 C6.8954305,2 6,2.8954305 6,4"></path>\n</svg>'
+
+blocks = {}
+debug_info = ''
\ No newline at end of file
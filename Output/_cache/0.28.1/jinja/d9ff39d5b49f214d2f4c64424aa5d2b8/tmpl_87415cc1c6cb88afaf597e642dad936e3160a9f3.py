@@ -0,0 +1,14 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'icons/ico16_reset.svg'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    pass
+    yield '<svg\n  class="svg_icon"\n  viewBox="0 0 16 16"\n  fill="none"\n  stroke="currentColor"\n  stroke-width="1.5"\n  stroke-linecap="round"\n  stroke-linejoin="round"\n>\n  <path d="M11,12 C7.5,14.5 3,12 3,7"/>\n  <path d="M5,4 C8.5,1.5 13,4 13,9"/>\n  <polyline points="5 8 3 6 1 8" />\n  <polyline points="11 8 13 10 15 8" />\n</svg>'
+
+blocks = {}
+debug_info = ''
\ No newline at end of file
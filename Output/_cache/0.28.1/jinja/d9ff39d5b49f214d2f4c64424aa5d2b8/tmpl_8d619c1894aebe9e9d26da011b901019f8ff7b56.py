@@ -0,0 +1,14 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'icons/ico16_gear.svg'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    pass
+    yield '<svg\n  class="svg_icon"\n  viewBox="0 0 16 16"\n  fill="none"\n  stroke="currentColor"\n  stroke-width="1.5"\n  stroke-linecap="round"\n  stroke-linejoin="round"\n>\n  <path d="M8,1 C8.56595772,1 9.11622811,1.06716542 9.64327511,1.19396018 C9.27781264,2.10325869 9.62708769,3.16589683 10.5,3.66987298 C11.372148,4.17340786 12.4659042,3.94541131 13.0707641,3.17626249 C13.8269351,3.96873681 14.3981481,4.94006734 14.7160129,6.01990491 C13.7451026,6.15884208 13,6.99240703 13,8 C13,9.00759297 13.7451026,9.84115792 14.7143711,9.97975825 C14.3981481,11.0599327 13.8269351,12.0312632 13.0711579,12.8253027 C12.4659042,12.0545887 11.372148,11.8265921 10.5,12.330127 C9.62708769,12.8341032 9.27781264,13.8967413 9.64305495,14.8056672 C9.11622811,14.9328346 8.56595772,15 8,15 C7.43404228,15 6.88377189,14.9328346 6.35672489,14.8060398 C6.72218736,13.8967413 6.37291231,12.8341032 5.5,12.330127 C4.62785201,11.8265921 3.53409577,12.0545887 2.9292359,12.8237375 C2.1730649,12.0312632 1.60185189,11.0599327 1.28398706,9.98009509 C2.25486237,9.84119716 3,9.00761669 3,8 C3,6.99238331 2.25486237,6.15880284 1.2855605,6.02023197 C1.60185189,4.94006734 2.1730649,3.96873681 2.9288421,3.17469733 C3.53409577,3.94541131 4.62785201,4.17340786 5.5,3.66987298 C6.37291231,3.16589683 6.72218736,2.10325869 6.35694505,1.19433282 C6.88377189,1.06716542 7.43404228,1 8,1 Z M8,6 C6.8954305,6 6,6.8954305 6,8 C6,9.1045695 6.8954305,10 8,10 C9.1045695,10 10,9.1045695 10,8 C10,6.8954305 9.1045695,6 8,6 Z"></path>\n</svg>'
+
+blocks = {}
+debug_info = ''
\ No newline at end of file
@@ -0,0 +1,21 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'screens/document/_shared/frame_viewtype_menu.jinja'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    pass
+    yield '<turbo-frame\n  id="frame-viewtype-menu"\n  style="display: contents"\n>\n  '
+    template = environment.get_template('screens/document/_shared/viewtype_menu.jinja', 'screens/document/_shared/frame_viewtype_menu.jinja')
+    gen = template.root_render_func(template.new_context(context.get_all(), True, {}))
+    try:
+        for event in gen:
+            yield event
+    finally: gen.close()
+    yield '\n</turbo-frame>'
+
+blocks = {}
+debug_info = '5=12'
\ No newline at end of file
@@ -0,0 +1,14 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'icons/ico16_folder.svg'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    pass
+    yield '<svg\n  class="svg_icon"\n  viewBox="0 0 16 16"\n  fill="none"\n  stroke="currentColor"\n  stroke-width="1.5"\n  stroke-linecap="round"\n  stroke-linejoin="round"\n>\n  <path d="M13,12 L13,8 C13,7.5 12.5,7 12,7 L9,7 C8.5,7 8,6.5 8,6 L8,5.5 C8,5 7.5,4.5 7,4.5 C5,4.5 4,4.5 4,4.5 C3.5,4.5 3,5 3,5.5 L3,12 C3,12.5 3.5,13 4,13 L12,13 C12.5,13 13,12.5 13,12 Z"></path>\n</svg>'
+
+blocks = {}
+debug_info = ''
\ No newline at end of file
@@ -0,0 +1,14 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'icons/ico16_folder_sm.svg'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    pass
+    yield '<svg\n  class="svg_icon"\n  viewBox="0 0 16 16"\n  fill="none"\n  stroke="currentColor"\n  stroke-width="1.5"\n  stroke-linecap="round"\n  stroke-linejoin="round"\n>\n  <path d="M12,11 L12,9 C12,8.5 11.5,8 11,8 L9,8 C8.5,8 8,7.5 8,7 L8,6.5 C8,6 7.5,5.5 7,5.5 C5.66666667,5.5 5,5.5 5,5.5 C4.5,5.5 4,6 4,6.5 L4,11 C4,11.5 4.5,12 5,12 L11,12 C11.5,12 12,11.5 12,11 Z"></path>\n</svg>'
+
+blocks = {}
+debug_info = ''
\ No newline at end of file
@@ -0,0 +1,14 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'icons/ico16_book.svg'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    pass
+    yield '<svg\n  class="svg_icon"\n  viewBox="0 0 16 16"\n  fill="none"\n  stroke="currentColor"\n  stroke-width="1.5"\n  stroke-linecap="round"\n  stroke-linejoin="round"\n>\n  <path d="M15,13 L10,13 C9,13 8,14 8,15 L8,3.1 C8,2 9,1 10,1 L15,1 L15,13 Z"></path>\n   <path d="M1,13 L6,13 C7,13 8,14 8,15 L8,3 C8,2 7,1 6,1 L1,1 L1,13 Z"></path>\n</svg>'
+
+blocks = {}
+debug_info = ''
\ No newline at end of file
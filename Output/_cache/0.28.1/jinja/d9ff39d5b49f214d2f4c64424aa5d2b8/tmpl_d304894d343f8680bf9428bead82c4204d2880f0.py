@@ -0,0 +1,21 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'components/checkbox/index.jinja'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    pass
+    yield '<template id="template-icon-checkbox">\n  \n    <label class="icon-checkbox">\n      <input type="checkbox">'
+    template = environment.get_template('icons/ico16_eye__stateful.svg', 'components/checkbox/index.jinja')
+    gen = template.root_render_func(template.new_context(context.get_all(), True, {}))
+    try:
+        for event in gen:
+            yield event
+    finally: gen.close()
+    yield '<span></span>\n    </label>\n  \n</template>'
+
+blocks = {}
+debug_info = '5=12'
\ No newline at end of file
@@ -0,0 +1,23 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'components/badge/index.jinja'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_badge_text = resolve('badge_text')
+    try:
+        t_1 = environment.filters['default']
+    except KeyError:
+        @internalcode
+        def t_1(*unused):
+            raise TemplateRuntimeError("No filter named 'default' found.")
+    pass
+    yield '<span class="badge" text="'
+    yield escape(t_1((undefined(name='badge_text') if l_0_badge_text is missing else l_0_badge_text), 'field'))
+    yield '"></span>'
+
+blocks = {}
+debug_info = '1=19'
\ No newline at end of file
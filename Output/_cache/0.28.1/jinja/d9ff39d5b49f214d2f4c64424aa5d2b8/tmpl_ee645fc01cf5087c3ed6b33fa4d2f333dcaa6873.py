@@ -0,0 +1,14 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'icons/ico16_minimize.svg'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    pass
+    yield '<svg\n  class="svg_icon"\n  viewBox="0 0 16 16"\n  fill="none"\n  stroke="currentColor"\n  stroke-width="1.5"\n  stroke-linecap="round"\n  stroke-linejoin="round"\n>\n  <polyline points="2.5 9.5 6.5 9.5 6.5 13.5"></polyline>\n  <line x1="9.5" y1="6.5" x2="13.5" y2="2.5"></line>\n  <line x1="6.5" y1="9.5" x2="2.5" y2="13.5"></line>\n  <polyline points="13.5 6.5 9.5 6.5 9.5 2.5"></polyline>\n</svg>'
+
+blocks = {}
+debug_info = ''
\ No newline at end of file
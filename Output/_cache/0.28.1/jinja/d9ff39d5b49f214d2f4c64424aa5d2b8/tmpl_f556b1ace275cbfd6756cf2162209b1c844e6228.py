@@ -0,0 +1,14 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'icons/ico16_plusplus.svg'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    pass
+    yield '<svg\n  class="svg_icon"\n  viewBox="0 0 16 16"\n  fill="none"\n  stroke="currentColor"\n  stroke-width="1.5"\n  stroke-linecap="round"\n  stroke-linejoin="round"\n>\n  <line x1="2.5" y1="5.5" x2="8.5" y2="5.5"></line>\n  <line x1="5.5" y1="8.5" x2="5.5" y2="2.5"></line>\n  <line x1="7.5" y1="10.5" x2="13.5" y2="10.5"></line>\n  <line x1="10.5" y1="13.5" x2="10.5" y2="7.5"></line>\n</svg>'
+
+blocks = {}
+debug_info = ''
\ No newline at end of file
@@ -0,0 +1,11 @@
+// map of the project for the stable_uri forwarder
+window.StrictDoc = window.StrictDoc || {};
+window.StrictDoc.project = window.StrictDoc.project || {};
+window.StrictDoc.project.map = {
+ "docs/hello.html": [
+
+
+  {"_LINK":"None-Hello-World" },
+
+  {"_LINK":"1ea69303f25344bfbac13466f6cfd9d0" }, ],
+};
\ No newline at end of file
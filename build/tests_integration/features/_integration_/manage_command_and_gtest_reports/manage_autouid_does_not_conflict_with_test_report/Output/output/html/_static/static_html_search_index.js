@@ -0,0 +1,5 @@
+window.StrictDoc = window.StrictDoc || {};
+window.StrictDoc.search = window.StrictDoc.search || {};
+window.StrictDoc.search.index = {"test":[1],"t":[1],"te":[1],"est":[1],"tes":[1],"st":[1]};
+
+window.StrictDoc.search.nodesByMid = {"1":{"MID":"1ea69303f25344bfbac13466f6cfd9d0","STATEMENT":"Test","_LINK":"1ea69303f25344bfbac13466f6cfd9d0"}};
@@ -0,0 +1,8 @@
+from strictdoc.core.project_config import ProjectConfig
+
+
+def create_config() -> ProjectConfig:
+    config = ProjectConfig(
+        document_line_width=80,
+    )
+    return config
@@ -0,0 +1,9 @@
+from strictdoc.core.project_config import ProjectConfig
+
+
+def create_config() -> ProjectConfig:
+    config = ProjectConfig(
+        project_title="Test",
+        document_line_width=80,
+    )
+    return config
@@ -0,0 +1,10 @@
+/**
+* @relation(LLR-1, scope=file)
+*/
+#include <stdio.h>
+
+int main(void)
+{
+    printf("Hello, StrictDoc!\n");
+    return 0;
+}
@@ -0,0 +1,9 @@
+// map of the project for the stable_uri forwarder
+window.StrictDoc = window.StrictDoc || {};
+window.StrictDoc.project = window.StrictDoc.project || {};
+window.StrictDoc.project.map = {
+ "deprecated_REQUIREMENT_IN_TOC/input.html": [
+
+
+  {"_LINK":"None-Hello-world-doc" }, ],
+};
\ No newline at end of file
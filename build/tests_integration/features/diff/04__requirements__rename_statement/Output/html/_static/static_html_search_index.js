@@ -0,0 +1,5 @@
+window.StrictDoc = window.StrictDoc || {};
+window.StrictDoc.search = window.StrictDoc.search || {};
+window.StrictDoc.search.index = {};
+
+window.StrictDoc.search.nodesByMid = {};